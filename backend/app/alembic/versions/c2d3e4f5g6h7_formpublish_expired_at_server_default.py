@@ -0,0 +1,37 @@
+"""formpublish expired_at server default
+
+Revision ID: c2d3e4f5g6h7
+Revises: b1c2d3e4f5g6
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2d3e4f5g6h7'
+down_revision = 'b1c2d3e4f5g6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # expired_at 기본값을 DB 에서 계산 (생성 시각 + 30일)
+    op.alter_column(
+        'formpublishtable',
+        'expired_at',
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=sa.text("LOCALTIMESTAMP + interval '30 days'"),
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'formpublishtable',
+        'expired_at',
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=None,
+    )
@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 import secrets
 from app.api.deps import SessionDep, CurrentUser
 from fastapi import APIRouter, HTTPException
-from sqlmodel import select
+from sqlmodel import func, select
 from app.api.formRegister.schemas import (
     FormRegisterRequest,
     FormRegisterResponse,
@@ -209,7 +209,8 @@ def create_form_publish(
         receiver=request.receiver,
         receiver_name=request.receiver_name,
         token=token,
-        expired_at=datetime.now() + timedelta(days=request.expired_days),
+        # 만료 시각은 DB 시계 기준으로 INSERT 시 계산
+        expired_at=func.localtimestamp() + timedelta(days=request.expired_days),
     )
     session.add(publish)
     session.commit()
@@ -245,7 +246,7 @@ def create_form_publish_batch(
             receiver=receiver_info.get("receiver", ""),
             receiver_name=receiver_info.get("receiver_name"),
             token=token,
-            expired_at=datetime.now() + timedelta(days=request.expired_days),
+            expired_at=func.localtimestamp() + timedelta(days=request.expired_days),
         )
         session.add(publish)
         created_count += 1
@@ -326,16 +327,21 @@ def get_form_stats(
         raise HTTPException(status_code=404, detail="Form not found")
     
     # 배포 목록 전체 조회
-    publish_statement = select(FormPublishTable).where(
+    # 만료 여부는 expired_at 과 같은 DB 시계로 판단
+    publish_statement = select(
+        FormPublishTable,
+        FormPublishTable.expired_at < func.localtimestamp(),
+    ).where(
         FormPublishTable.form_idx == form.idx
     )
-    publishes = session.exec(publish_statement).all()
+    rows = session.exec(publish_statement).all()
+    publishes = [publish for publish, _ in rows]
     
     # 배포 현황 통계
     total_count = len(publishes)
     submitted_count = sum(1 for p in publishes if p.is_submitted)
     pending_count = total_count - submitted_count
-    expired_count = sum(1 for p in publishes if not p.is_submitted and p.expired_at < datetime.now())
+    expired_count = sum(1 for p, is_expired in rows if not p.is_submitted and is_expired)
     email_sent_count = sum(1 for p in publishes if p.is_email_sent)
     email_not_sent_count = total_count - email_sent_count
     
@@ -462,13 +468,17 @@ def get_public_form(
 ):
     """공개 폼 조회 (토큰으로 접근, 로그인 불필요)"""
     # 배포 정보 조회
-    statement = select(FormPublishTable).where(FormPublishTable.token == token)
-    publish = session.exec(statement).first()
-    if not publish:
+    statement = select(
+        FormPublishTable,
+        FormPublishTable.expired_at < func.localtimestamp(),
+    ).where(FormPublishTable.token == token)
+    row = session.exec(statement).first()
+    if not row:
         raise HTTPException(status_code=404, detail="유효하지 않은 링크입니다")
+    publish, is_expired = row
     
-    # 만료 확인
-    if publish.expired_at < datetime.now():
+    # 만료 확인 (expired_at 과 같은 DB 시계 기준)
+    if is_expired:
         raise HTTPException(status_code=410, detail="링크가 만료되었습니다")
     
     # 폼 조회
@@ -502,13 +512,17 @@ def submit_public_form(
 ):
     """공개 폼 제출 (만료 전까지 수정 가능)"""
     # 배포 정보 조회
-    statement = select(FormPublishTable).where(FormPublishTable.token == token)
-    publish = session.exec(statement).first()
-    if not publish:
+    statement = select(
+        FormPublishTable,
+        FormPublishTable.expired_at < func.localtimestamp(),
+    ).where(FormPublishTable.token == token)
+    row = session.exec(statement).first()
+    if not row:
         raise HTTPException(status_code=404, detail="유효하지 않은 링크입니다")
+    publish, is_expired = row
     
-    # 만료 확인
-    if publish.expired_at < datetime.now():
+    # 만료 확인 (expired_at 과 같은 DB 시계 기준)
+    if is_expired:
         raise HTTPException(status_code=410, detail="링크가 만료되었습니다")
     
     # 제출/수정 처리 (만료 전까지 수정 가능)
@@ -7,7 +7,7 @@ from pydantic import BaseModel, EmailStr
 
 from app.api.deps import CurrentUser
 from app.services.directsend import (
-    mail_service,
+    get_mail_service,
     MailRequest,
     MailReceiver,
     DirectSendResponse,
@@ -42,6 +42,7 @@ async def send_mail(
     - 로그인한 사용자만 사용 가능
     - DirectSend API를 통해 메일 발송
     """
+    mail_service = get_mail_service()
     if not mail_service.is_configured:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -68,7 +69,8 @@ async def send_mail(
             detail=f"Invalid receiver format: {str(e)}",
         )
     
-    mail_request = MailRequest(
+    # receivers 는 위에서 검증 완료 -> 재검증 없이 구성
+    mail_request = MailRequest.model_construct(
         subject=request.subject,
         body=request.body,
         receivers=receivers,
@@ -92,7 +94,7 @@ async def get_mail_service_status(
     메일 서비스 상태 확인
     """
     return {
-        "configured": mail_service.is_configured,
+        "configured": get_mail_service().is_configured,
         "service": "DirectSend Mail",
     }
 
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from app.api.deps import CurrentUser
 from app.services.directsend import (
-    sms_service,
+    get_sms_service,
     SMSRequest,
     SMSReceiver,
     DirectSendResponse,
@@ -42,6 +42,7 @@ async def send_sms(
     - 로그인한 사용자만 사용 가능
     - DirectSend API를 통해 SMS 발송
     """
+    sms_service = get_sms_service()
     if not sms_service.is_configured:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -68,7 +69,8 @@ async def send_sms(
             detail=f"Invalid receiver format: {str(e)}",
         )
     
-    sms_request = SMSRequest(
+    # receivers 는 위에서 검증 완료 -> 재검증 없이 구성
+    sms_request = SMSRequest.model_construct(
         title=request.title,
         message=request.message,
         receivers=receivers,
@@ -92,7 +94,7 @@ async def get_sms_service_status(
     SMS 서비스 상태 확인
     """
     return {
-        "configured": sms_service.is_configured,
+        "configured": get_sms_service().is_configured,
         "service": "DirectSend SMS",
     }
 
@@ -17,6 +17,22 @@ from sqlmodel import SQLModel, Sequence, Session
 import logging
 logger = logging.getLogger(__name__)
 
+# import type { ... } from '...' 형태의 줄 매칭 (모듈 로드 시 1회 컴파일)
+_IMPORT_TYPE_RE = re.compile(r"(\s*)import type \{ ([^}]+) \} from '([^']+)'")
+
+# find_files 패턴별 컴파일 결과 캐시
+_ROUTES_RE_CACHE: dict[str, re.Pattern] = {}
+
+# get_file_hash 는 변경 감지 용도로만 사용 (보안 용도 아님)
+# xxhash 가 설치되어 있으면 xxh3_128, 없으면 blake2b(16바이트) 사용 - 둘 다 32자리 hex
+try:
+    from xxhash import xxh3_128 as _new_hash
+except ImportError:
+    _new_hash = functools.partial(hashlib.blake2b, digest_size=16)
+
+# sqlmodel_to_jsonable 에서 사용하는 C 기반 JSON 인코더
+import orjson
+
 
 def get_file_hash(content: str) -> str:
     """
@@ -25,9 +41,10 @@ def get_file_hash(content: str) -> str:
     - 끝에 있는 공백 제거
     - 파일 끝 줄바꿈 통일
     - import 문의 타입 순서 정렬
-    """
-    import re
 
+    변경 감지 전용 해시이므로 MD5 대신 더 빠른 xxh3_128 / blake2b 를 사용한다.
+    같은 배포 환경 안에서만 비교 가능하다.
+    """
     # 줄바꿈 문자 통일
     normalized_content = content.replace("\r\n", "\n").replace("\r", "\n")
 
@@ -37,7 +54,7 @@ def get_file_hash(content: str) -> str:
 
     for line in lines:
         # import type { ... } 형태의 줄 찾기
-        import_match = re.match(r"(\s*)import type \{ ([^}]+) \} from '([^']+)'", line)
+        import_match = _IMPORT_TYPE_RE.match(line)
         if import_match:
             indent, types_str, from_path = import_match.groups()
             # 타입들을 분리하고 정렬
@@ -60,11 +77,13 @@ def get_file_hash(content: str) -> str:
         normalized_lines.pop()
 
     # 하나의 줄바꿈으로 끝나도록 통일
-    normalized_content = "\n".join(normalized_lines)
-    if normalized_content and not normalized_content.endswith("\n"):
-        normalized_content += "\n"
+    # 전체 문자열을 join/encode 하지 않고 줄 단위로 해시에 공급 (피크 메모리 절감)
+    hasher = _new_hash()
+    for line in normalized_lines:
+        hasher.update(line.encode("utf-8"))
+        hasher.update(b"\n")
 
-    return hashlib.md5(normalized_content.encode("utf-8")).hexdigest()
+    return hasher.hexdigest()
 
 
 # utils.py 전용 로거 생성 (비활성화)
@@ -86,14 +105,16 @@ def convert_mappings_to_model(mapping_results, model_class):
 
 def find_files(base_dir: str = "api", pattern=r"routes\.py$") -> List[str]:
     route_files = []
-    pattern = re.compile(pattern)
+    compiled = _ROUTES_RE_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _ROUTES_RE_CACHE[pattern] = re.compile(pattern)
 
     if not os.path.exists(base_dir):
         raise FileNotFoundError(f"Directory '{base_dir}' does not exist")
 
     for root, _, files in os.walk(base_dir):
         for file in files:
-            if pattern.search(file):
+            if compiled.search(file):
                 # routes.py 파일 경로
                 py_path = os.path.join(root, file).replace("\\", "/")
 
@@ -197,70 +218,68 @@ def sqlmodel_to_json(
     """
     SQLModel/SQLAlchemy 객체를 JSON 직렬화 가능한 형태로 변환
 
-    Args:
-        obj: 변환할 객체
-        exclude_fields: 제외할 필드 이름 집합
-        max_depth: 재귀 깊이 제한
-
-    Returns:
-        JSON 직렬화 가능한 객체
+    sqlmodel_to_jsonable 로 옮기는 동안 유지하는 호환용 래퍼.
+    max_depth 는 더 이상 사용하지 않는다 (깊이 제한은 orjson 이 처리).
     """
-    if exclude_fields is None:
-        exclude_fields = {"hashed_password", "password"}
+    return sqlmodel_to_jsonable(obj, exclude_fields)
 
-    if max_depth <= 0:
-        return None
 
-    # 기본 타입 처리
-    if obj is None or isinstance(obj, (str, int, float, bool)):
-        return obj
-
-    # 열거형 처리
-    if isinstance(obj, Enum):
-        return obj
-
-    # 날짜/시간 처리
-    if isinstance(obj, (datetime, date)):
-        return obj
+def _jsonable_default(obj: Any, exclude_fields: Set[str]) -> Any:
+    """orjson 이 직접 처리하지 못하는 객체의 변환 규칙 (제외 필드는 여기서 제거)"""
+    if isinstance(obj, SQLModel):
+        return obj.model_dump(exclude=exclude_fields)
+    if hasattr(obj, "_mapping"):
+        return {k: v for k, v in obj._mapping.items() if k not in exclude_fields}
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
 
-    # 리스트 처리
-    if isinstance(obj, list):
-        return [sqlmodel_to_json(item, exclude_fields, max_depth - 1) for item in obj]
 
-    # 딕셔너리 처리
+def _exclude_from_dicts(obj: Any, exclude_fields: Set[str]) -> Any:
+    """입력에 들어있는 일반 dict 에서 제외 필드 제거 (dict/list/tuple 만 순회)"""
     if isinstance(obj, dict):
         return {
-            k: sqlmodel_to_json(v, exclude_fields, max_depth - 1)
+            k: _exclude_from_dicts(v, exclude_fields)
             for k, v in obj.items()
             if k not in exclude_fields
         }
+    if isinstance(obj, (list, tuple)):
+        return [_exclude_from_dicts(v, exclude_fields) for v in obj]
+    return obj
 
-    # SQLModel 객체 처리
-    if isinstance(obj, SQLModel):
-        return {
-            k: sqlmodel_to_json(v, exclude_fields, max_depth - 1)
-            for k, v in obj.dict().items()
-            if k not in exclude_fields
-        }
 
-    # SQLAlchemy 모델 객체 처리
-    if hasattr(obj, "__table__"):
-        result = {}
-        for key, value in inspect.getmembers(obj):
-            if key.startswith("_") or callable(value) or key in exclude_fields:
-                continue
-            result[key] = sqlmodel_to_json(value, exclude_fields, max_depth - 1)
-        return result
+def sqlmodel_to_jsonable(obj: Any, exclude_fields: Set[str] | None = None) -> Any:
+    """
+    SQLModel/Row 객체를 JSON 호환(dict/list/str/...) 형태로 변환
 
-    # Row/RowMapping 처리
-    if hasattr(obj, "_mapping"):
-        return sqlmodel_to_json(dict(obj._mapping), exclude_fields, max_depth - 1)
+    orjson(C 인코더)으로 한 번에 직렬화 후 다시 로드한다.
+    제외 필드는 SQLModel/Row 를 변환하는 시점에 빠지고, 입력에 일반 dict 가
+    섞여 있을 때만 입력을 한 번 순회해 해당 dict 에서도 제거한다.
+    datetime/UUID/Enum 은 문자열 값으로 변환된다 (naive datetime 은 오프셋 없이).
 
-    # 일반 객체는 문자열로 변환
-    try:
-        return str(obj)
-    except Exception:
-        return None
+    Args:
+        obj: 변환할 객체
+        exclude_fields: 제외할 필드 이름 집합
+
+    Returns:
+        JSON 호환 객체
+    """
+    if exclude_fields is None:
+        exclude_fields = {"hashed_password", "password"}
+
+    if isinstance(obj, dict) or (
+        isinstance(obj, (list, tuple))
+        and any(isinstance(v, (dict, list, tuple)) for v in obj)
+    ):
+        obj = _exclude_from_dicts(obj, exclude_fields)
+
+    return orjson.loads(
+        orjson.dumps(
+            obj,
+            default=functools.partial(_jsonable_default, exclude_fields=exclude_fields),
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+    )
 
 
 @deprecated("deprecated")
@@ -277,7 +296,7 @@ def Row_to_object(result):
     # row._mapping을 통해 별칭 정보에 접근
     mapping = result._mapping
 
-    for key, value in mapping.items():
+    for i, (key, value) in enumerate(mapping.items()):
         # 키 이름으로 별칭 사용
         if isinstance(key, str):
             structured_result[key] = value
@@ -287,9 +306,7 @@ def Row_to_object(result):
             if type_name not in structured_result:
                 structured_result[type_name] = value
             else:
-                structured_result[f"{type_name}_{list(mapping.keys()).index(key)}"] = (
-                    value
-                )
+                structured_result[f"{type_name}_{i}"] = value
 
     return structured_result
 
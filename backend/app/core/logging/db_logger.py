@@ -6,11 +6,11 @@ import time
 import traceback
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from uuid import UUID
 import inspect
 
-from sqlmodel import Session, select
+from sqlmodel import Session, or_, select
 from eventsourcing.domain import DomainEventProtocol
 from eventsourcing.application import ProcessingEvent
 from eventsourcing.dispatch import singledispatchmethod
@@ -25,6 +25,16 @@ from models.LogModels import (
 )
 
 
+# get_recent_logs 용 log_type -> (모델, 정렬 컬럼) 매핑
+_LOG_VIEWS = {
+    "system": (SystemLog, SystemLog.logged_at),
+    "event": (EventLog, EventLog.occurred_at),
+    "api": (APILog, APILog.requested_at),
+    "audit": (AuditLog, AuditLog.performed_at),
+    "performance": (PerformanceLog, PerformanceLog.measured_at),
+}
+
+
 class DatabaseLogger:
     """데이터베이스 로거 - 모든 로그를 DB에 저장"""
     
@@ -41,14 +51,21 @@ class DatabaseLogger:
         level: LogLevel = LogLevel.INFO,
         category: LogCategory = LogCategory.SYSTEM,
         extra_data: Optional[Dict[str, Any]] = None,
-        error: Optional[Exception] = None
+        error: Optional[Exception] = None,
+        _caller: Optional[Tuple[str, str, int]] = None
     ):
-        """시스템 로그 기록"""
+        """시스템 로그 기록
+
+        _caller: (module, function, line_number) - 호출 지점이 고정된 곳에서 넘기면 프레임 조회를 생략
+        """
         # 호출 정보 추출
-        frame = inspect.currentframe().f_back
-        module = frame.f_globals.get('__name__', '')
-        function = frame.f_code.co_name
-        line_number = frame.f_lineno
+        if _caller is not None:
+            module, function, line_number = _caller
+        else:
+            frame = inspect.currentframe().f_back
+            module = frame.f_globals.get('__name__', '')
+            function = frame.f_code.co_name
+            line_number = frame.f_lineno
         
         log = SystemLog(
             level=level,
@@ -61,32 +78,53 @@ class DatabaseLogger:
         )
         
         # 에러 정보 추가
-        if error:
+        if error is not None:
             log.error_type = type(error).__name__
             log.error_message = str(error)
-            log.traceback = traceback.format_exc()
+            # format_exc() 는 except 블록 안에서만 의미가 있으므로 예외 객체의 traceback 을 직접 사용
+            # WARNING 이하로 기록되는 에러는 traceback 포맷팅 비용을 생략
+            if level in (LogLevel.ERROR, LogLevel.CRITICAL):
+                log.traceback = "".join(
+                    traceback.format_exception(type(error), error, error.__traceback__)
+                )
         
         self._save_log(log)
     
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, _caller: Optional[Tuple[str, str, int]] = None, **kwargs):
         """디버그 로그"""
-        self.log_system(message, LogLevel.DEBUG, extra_data=kwargs)
+        self.log_system(message, LogLevel.DEBUG, extra_data=kwargs, _caller=_caller)
     
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, _caller: Optional[Tuple[str, str, int]] = None, **kwargs):
         """정보 로그"""
-        self.log_system(message, LogLevel.INFO, extra_data=kwargs)
+        self.log_system(message, LogLevel.INFO, extra_data=kwargs, _caller=_caller)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, _caller: Optional[Tuple[str, str, int]] = None, **kwargs):
         """경고 로그"""
-        self.log_system(message, LogLevel.WARNING, extra_data=kwargs)
+        self.log_system(message, LogLevel.WARNING, extra_data=kwargs, _caller=_caller)
     
-    def error(self, message: str, error: Optional[Exception] = None, **kwargs):
+    def error(
+        self,
+        message: str,
+        error: Optional[Exception] = None,
+        _caller: Optional[Tuple[str, str, int]] = None,
+        **kwargs
+    ):
         """에러 로그"""
-        self.log_system(message, LogLevel.ERROR, extra_data=kwargs, error=error)
+        self.log_system(
+            message, LogLevel.ERROR, extra_data=kwargs, error=error, _caller=_caller
+        )
     
-    def critical(self, message: str, error: Optional[Exception] = None, **kwargs):
+    def critical(
+        self,
+        message: str,
+        error: Optional[Exception] = None,
+        _caller: Optional[Tuple[str, str, int]] = None,
+        **kwargs
+    ):
         """치명적 에러 로그"""
-        self.log_system(message, LogLevel.CRITICAL, extra_data=kwargs, error=error)
+        self.log_system(
+            message, LogLevel.CRITICAL, extra_data=kwargs, error=error, _caller=_caller
+        )
     
     # ================= 이벤트 로그 =================
     
@@ -262,30 +300,30 @@ class DatabaseLogger:
     
     def get_recent_logs(self, log_type: str, limit: int = 100):
         """최근 로그 조회"""
-        if log_type == "system":
-            stmt = select(SystemLog).order_by(SystemLog.logged_at.desc()).limit(limit)
-        elif log_type == "event":
-            stmt = select(EventLog).order_by(EventLog.occurred_at.desc()).limit(limit)
-        elif log_type == "api":
-            stmt = select(APILog).order_by(APILog.requested_at.desc()).limit(limit)
-        elif log_type == "audit":
-            stmt = select(AuditLog).order_by(AuditLog.performed_at.desc()).limit(limit)
-        elif log_type == "performance":
-            stmt = select(PerformanceLog).order_by(PerformanceLog.measured_at.desc()).limit(limit)
-        else:
+        model, order_col = _LOG_VIEWS.get(log_type, (None, None))
+        if model is None:
             return []
-        
+
+        stmt = select(model).order_by(order_col.desc()).limit(limit)
         return self.session.exec(stmt).all()
     
     def get_error_logs(self, limit: int = 100):
-        """에러 로그 조회"""
+        """에러 로그 조회
+
+        IN 리스트 대신 OR 조건으로 작성하여
+        (logged_at DESC) WHERE level IN ('ERROR', 'CRITICAL') 부분 인덱스를 탈 수 있게 한다.
+        """
         stmt = select(SystemLog).where(
-            SystemLog.level.in_([LogLevel.ERROR, LogLevel.CRITICAL])
+            or_(SystemLog.level == LogLevel.ERROR, SystemLog.level == LogLevel.CRITICAL)
         ).order_by(SystemLog.logged_at.desc()).limit(limit)
         
         return self.session.exec(stmt).all()
 
 
+# policy 의 로그 호출 지점은 고정이므로 (module, function, line_number) 를 미리 만들어 둔다
+_POLICY_CALLER = (__name__, "policy", 0)
+
+
 class LoggingProcessApplication(ProcessApplication[UUID]):
     """로깅 기능이 포함된 ProcessApplication"""
     
@@ -314,6 +352,7 @@ class LoggingProcessApplication(ProcessApplication[UUID]):
             # 시스템 로그
             self.logger.info(
                 f"Event processed: {type(domain_event).__name__}",
+                _caller=_POLICY_CALLER,
                 event_count=self.event_count,
                 processing_time_ms=processing_time
             )
@@ -329,7 +368,8 @@ class LoggingProcessApplication(ProcessApplication[UUID]):
         except Exception as e:
             self.logger.error(
                 f"Error processing event: {type(domain_event).__name__}",
-                error=e
+                error=e,
+                _caller=_POLICY_CALLER
             )
 
 
@@ -6,53 +6,114 @@
 - 상태 변경 로직 중앙 집중
 - 디버깅 용이
 """
+from collections import Counter, deque
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from types import SimpleNamespace
+from sqlalchemy import bindparam, case, func, insert, literal, update
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 from enum import Enum
 
 
+# _calculate_display_status 용 출고 상태 집계 규칙 (위에서부터 먼저 일치하는 라벨 사용)
+_DISPLAY_RULES = [
+    (lambda summary: summary["delivered"] == summary["total"], "배송완료"),
+    (lambda summary: summary["shipped"] > 0, "배송중"),
+    (lambda summary: summary["preparing"] > 0, "상품준비중"),
+]
+
+# ItemTransaction 의 item_idx/quantity 외 컬럼 값 (행 구성의 단일 지점)
+# 실제 구현은 TransactionModels 구조에 맞춰 조정 (transaction_type, reference 등 추가)
+_ITEM_TRANSACTION_COLUMNS = {"status": "COMPLETED"}
+
+# 도메인 모델 네임스페이스 (순환 import 방지를 위해 첫 중재자 생성 시 1회 로드)
+_MODELS: Optional[SimpleNamespace] = None
+
+
+def _get_models() -> SimpleNamespace:
+    """중재자에서 사용하는 모델 클래스들을 한 번만 import 하여 반환"""
+    global _MODELS
+    if _MODELS is None:
+        from models.SalesModels import SalesOrder, SalesOrderDetail, SalesOrderStatus
+        from models.ShipmentModels import Shipment, ShipmentDetail, ShipmentStatus
+        from models.TransactionsModels.Item import ItemTransaction
+
+        _MODELS = SimpleNamespace(
+            SalesOrder=SalesOrder,
+            SalesOrderDetail=SalesOrderDetail,
+            SalesOrderStatus=SalesOrderStatus,
+            Shipment=Shipment,
+            ShipmentDetail=ShipmentDetail,
+            ShipmentStatus=ShipmentStatus,
+            ItemTransaction=ItemTransaction,
+        )
+    return _MODELS
+
+
+# _get_order_shipments 용 주문별 출고 조회 문 (최초 사용 시 1회 생성 후 재사용)
+_ORDER_SHIPMENTS_STMT = None
+
+
 class OrderFlowMediator:
     """주문 플로우 중재자 - 모든 상태 변경의 단일 진입점"""
     
     def __init__(self, session: Session):
         self.session = session
-        self._listeners = []
+        self._M = _get_models()
+        self._listeners: tuple = ()
+        self._on_event_callbacks: tuple = ()  # 리스너별 on_event 바운드 메서드 캐시
+        self._pending_tx_rows: List[Dict[str, Any]] = []  # 커밋 전 일괄 INSERT 할 재고 트랜잭션
+        self._uow_depth = 0  # 중첩된 _unit_of_work 깊이
+        self._event_queue: deque = deque()  # (event, entity) 대기열
+        self._dispatching = False  # 이벤트 펌프 실행 중 여부
     
     # ========================= 주문 상태 변경 =========================
     
     def confirm_order(self, order_idx: int) -> Dict[str, Any]:
         """주문 확정 - 결제 완료 후"""
-        from models.SalesModels import SalesOrder, SalesOrderStatus
-        from models.TransactionsModels.Item import ItemTransaction
-        
-        order = self.session.get(SalesOrder, order_idx)
-        if not order:
-            raise ValueError(f"Order {order_idx} not found")
-        
-        # 상태 검증
-        if order.status != SalesOrderStatus.PENDING:
-            raise ValueError(f"Cannot confirm order in {order.status} status")
-        
-        # 1. 주문 상태 변경
-        order.status = SalesOrderStatus.CONFIRMED
-        order.confirmed_at = datetime.now()
-        
-        # 2. 재고 예약
-        for detail in order.details:
-            self._create_inventory_transaction(
-                item_idx=detail.item_idx,
-                quantity=-detail.quantity,  # 예약은 음수
-                transaction_type="RESERVE",
-                reference_type="SalesOrder",
-                reference_idx=order_idx
-            )
-        
-        # 3. 출고 지시 생성 (자동 또는 수동)
-        if order.auto_create_shipment:
-            self.create_shipment_from_order(order_idx)
+        M = self._M
+        
+        with self._unit_of_work():
+            order = self.session.exec(
+                select(M.SalesOrder)
+                .options(selectinload(M.SalesOrder.details))
+                .where(M.SalesOrder.idx == order_idx)
+            ).first()
+            if not order:
+                raise ValueError(f"Order {order_idx} not found")
+            
+            # 이미 확정된 주문 (중복 요청/재시도) - 쓰기 없이 반환
+            if order.status == M.SalesOrderStatus.CONFIRMED:
+                return {
+                    "success": True,
+                    "order_status": order.status,
+                    "message": "이미 확정된 주문입니다"
+                }
+            
+            # 상태 검증
+            if order.status != M.SalesOrderStatus.PENDING:
+                raise ValueError(f"Cannot confirm order in {order.status} status")
+            
+            # 1. 주문 상태 변경
+            order.status = M.SalesOrderStatus.CONFIRMED
+            order.confirmed_at = datetime.now()
+            
+            # 2. 재고 예약
+            for detail in order.details:
+                self._create_inventory_transaction(
+                    item_idx=detail.item_idx,
+                    quantity=-detail.quantity,  # 예약은 음수
+                    transaction_type="RESERVE",
+                    reference_type="SalesOrder",
+                    reference_idx=order_idx
+                )
+            
+            # 3. 출고 지시 생성 (자동 또는 수동)
+            if order.auto_create_shipment:
+                self.create_shipment_from_order(order_idx)
         
-        self.session.commit()
         self._notify_listeners("ORDER_CONFIRMED", order)
         
         return {
@@ -63,43 +124,45 @@ class OrderFlowMediator:
     
     def cancel_order(self, order_idx: int, reason: str = None) -> Dict[str, Any]:
         """주문 취소"""
-        from models.SalesModels import SalesOrder, SalesOrderStatus
-        
-        order = self.session.get(SalesOrder, order_idx)
-        if not order:
-            raise ValueError(f"Order {order_idx} not found")
-        
-        # 상태 검증 - COMPLETED는 취소 불가
-        if order.status == SalesOrderStatus.COMPLETED:
-            raise ValueError("완료된 주문은 취소할 수 없습니다")
-        
-        # 1. 관련 출고 확인
-        shipments = self._get_order_shipments(order_idx)
-        for shipment in shipments:
-            if shipment.status in ['SHIPPED', 'DELIVERED']:
-                raise ValueError("이미 출고/배송된 주문은 취소할 수 없습니다")
-        
-        # 2. 출고 취소
-        for shipment in shipments:
-            self.cancel_shipment(shipment.idx, f"주문 취소: {reason}")
+        M = self._M
         
-        # 3. 재고 예약 해제
-        if order.status == SalesOrderStatus.CONFIRMED:
-            for detail in order.details:
-                self._create_inventory_transaction(
-                    item_idx=detail.item_idx,
-                    quantity=detail.quantity,  # 예약 해제는 양수
-                    transaction_type="RESERVE_CANCEL",
-                    reference_type="SalesOrder",
-                    reference_idx=order_idx
+        with self._unit_of_work():
+            order = self.session.get(M.SalesOrder, order_idx)
+            if not order:
+                raise ValueError(f"Order {order_idx} not found")
+            
+            # 상태 검증 - COMPLETED는 취소 불가
+            if order.status == M.SalesOrderStatus.COMPLETED:
+                raise ValueError("완료된 주문은 취소할 수 없습니다")
+            
+            # 1. 관련 출고 확인
+            shipments = self._get_order_shipments(order_idx)
+            for shipment in shipments:
+                if shipment.status in ['SHIPPED', 'DELIVERED']:
+                    raise ValueError("이미 출고/배송된 주문은 취소할 수 없습니다")
+            
+            # 2. 출고 취소
+            for shipment in shipments:
+                self.cancel_shipment(shipment.idx, f"주문 취소: {reason}")
+            
+            # 3. 재고 예약 해제 - 주문 상세에서 바로 INSERT ... SELECT (예약 해제는 양수)
+            if order.status == M.SalesOrderStatus.CONFIRMED:
+                self.session.execute(
+                    insert(M.ItemTransaction).from_select(
+                        ["item_idx", "quantity", *_ITEM_TRANSACTION_COLUMNS],
+                        select(
+                            M.SalesOrderDetail.item_idx,
+                            M.SalesOrderDetail.quantity,
+                            *(literal(value) for value in _ITEM_TRANSACTION_COLUMNS.values()),
+                        ).where(M.SalesOrderDetail.order_idx == order_idx),
+                    )
                 )
+            
+            # 4. 주문 상태 변경
+            order.status = M.SalesOrderStatus.CANCELLED
+            order.cancelled_at = datetime.now()
+            order.cancel_reason = reason
         
-        # 4. 주문 상태 변경
-        order.status = SalesOrderStatus.CANCELLED
-        order.cancelled_at = datetime.now()
-        order.cancel_reason = reason
-        
-        self.session.commit()
         self._notify_listeners("ORDER_CANCELLED", order)
         
         return {
@@ -112,48 +175,51 @@ class OrderFlowMediator:
     
     def create_shipment_from_order(self, order_idx: int) -> Dict[str, Any]:
         """주문에서 출고 생성"""
-        from models.SalesModels import SalesOrder, SalesOrderStatus
-        from models.ShipmentModels import Shipment, ShipmentDetail
-        
-        order = self.session.get(SalesOrder, order_idx)
-        if not order:
-            raise ValueError(f"Order {order_idx} not found")
-        
-        # 상태 검증
-        if order.status != SalesOrderStatus.CONFIRMED:
-            raise ValueError(f"Cannot create shipment for {order.status} order")
+        M = self._M
         
-        # 1. 출고 생성
-        shipment = Shipment(
-            shipment_no=Shipment.generate_shipment_no(self.session),
-            shipment_date=datetime.now(),
-            shipment_type="SALES",
-            source_type="SALES_ORDER",
-            source_idx=order_idx,
-            from_location_idx=order.default_warehouse_idx,
-            receiver_name=order.receiver,
-            receiver_contact=order.primary_contact,
-            delivery_address=order.address,
-            delivery_memo=order.delivery_request,
-            status="PENDING"
-        )
-        self.session.add(shipment)
-        self.session.flush()  # ID 생성
-        
-        # 2. 출고 상세 생성
-        for detail in order.details:
-            shipment_detail = ShipmentDetail(
-                shipment_idx=shipment.idx,
-                item_idx=detail.item_idx,
-                requested_quantity=detail.quantity,
-                source_detail_idx=detail.idx
+        with self._unit_of_work():
+            order = self.session.get(M.SalesOrder, order_idx)
+            if not order:
+                raise ValueError(f"Order {order_idx} not found")
+            
+            # 상태 검증
+            if order.status != M.SalesOrderStatus.CONFIRMED:
+                raise ValueError(f"Cannot create shipment for {order.status} order")
+            
+            # 1. 출고 생성
+            shipment = M.Shipment(
+                shipment_no=M.Shipment.generate_shipment_no(self.session),
+                shipment_date=datetime.now(),
+                shipment_type="SALES",
+                source_type="SALES_ORDER",
+                source_idx=order_idx,
+                from_location_idx=order.default_warehouse_idx,
+                receiver_name=order.receiver,
+                receiver_contact=order.primary_contact,
+                delivery_address=order.address,
+                delivery_memo=order.delivery_request,
+                status="PENDING"
             )
-            self.session.add(shipment_detail)
-        
-        # 3. 주문 상태 변경
-        order.status = SalesOrderStatus.PREPARING
+            self.session.add(shipment)
+            self.session.flush()  # ID 생성
+            
+            # 2. 출고 상세 생성 (한 번의 bulk INSERT)
+            self.session.bulk_insert_mappings(
+                M.ShipmentDetail,
+                [
+                    {
+                        "shipment_idx": shipment.idx,
+                        "item_idx": detail.item_idx,
+                        "requested_quantity": detail.quantity,
+                        "source_detail_idx": detail.idx,
+                    }
+                    for detail in order.details
+                ],
+            )
+            
+            # 3. 주문 상태 변경
+            order.status = M.SalesOrderStatus.PREPARING
         
-        self.session.commit()
         self._notify_listeners("SHIPMENT_CREATED", shipment)
         
         return {
@@ -165,61 +231,61 @@ class OrderFlowMediator:
     
     def process_shipment(self, shipment_idx: int, action: str) -> Dict[str, Any]:
         """출고 처리"""
-        from models.ShipmentModels import Shipment, ShipmentStatus
-        from models.SalesModels import SalesOrder, SalesOrderStatus
-        
-        shipment = self.session.get(Shipment, shipment_idx)
-        if not shipment:
-            raise ValueError(f"Shipment {shipment_idx} not found")
-        
-        if action == "SHIP":
-            # 1. 재고 차감
-            for detail in shipment.details:
-                # 예약 해제
-                self._create_inventory_transaction(
-                    item_idx=detail.item_idx,
-                    quantity=detail.requested_quantity,
-                    transaction_type="RESERVE_CANCEL",
-                    reference_type="Shipment",
-                    reference_idx=shipment_idx
-                )
-                # 실제 차감
-                self._create_inventory_transaction(
-                    item_idx=detail.item_idx,
-                    quantity=-detail.shipped_quantity or -detail.requested_quantity,
-                    transaction_type="SHIP",
-                    reference_type="Shipment", 
-                    reference_idx=shipment_idx
-                )
-            
-            # 2. 출고 상태 변경
-            shipment.status = ShipmentStatus.SHIPPED
-            shipment.shipped_at = datetime.now()
-            
-            # 3. 주문 상태 변경 (source가 주문인 경우)
-            if shipment.source_type == "SALES_ORDER":
-                order = self.session.get(SalesOrder, shipment.source_idx)
-                if order:
-                    order.status = SalesOrderStatus.SHIPPED
+        M = self._M
+        
+        with self._unit_of_work():
+            shipment = self.session.exec(
+                select(M.Shipment)
+                .options(selectinload(M.Shipment.details))
+                .where(M.Shipment.idx == shipment_idx)
+            ).first()
+            if not shipment:
+                raise ValueError(f"Shipment {shipment_idx} not found")
             
-        elif action == "DELIVER":
-            # 1. 출고 상태 변경
-            shipment.status = ShipmentStatus.DELIVERED
-            shipment.delivered_at = datetime.now()
-            
-            # 2. 주문 상태 변경 (source가 주문인 경우)
-            if shipment.source_type == "SALES_ORDER":
-                order = self.session.get(SalesOrder, shipment.source_idx)
-                if order:
-                    # 모든 출고가 배송 완료인지 확인
-                    all_delivered = all(
-                        s.status == ShipmentStatus.DELIVERED 
-                        for s in self._get_order_shipments(order.idx)
+            if action == "SHIP":
+                # 1. 재고 차감 (커밋 시 _flush_inventory_transactions 에서 한 번에 INSERT)
+                for detail in shipment.details:
+                    # 예약 해제
+                    self._create_inventory_transaction(
+                        item_idx=detail.item_idx,
+                        quantity=detail.requested_quantity,
+                        transaction_type="RESERVE_CANCEL",
+                        reference_type="Shipment",
+                        reference_idx=shipment_idx
                     )
-                    if all_delivered:
-                        order.status = SalesOrderStatus.DELIVERED
+                    # 실제 차감 - 출고수량 미입력(None/0) 시 요청수량
+                    self._create_inventory_transaction(
+                        item_idx=detail.item_idx,
+                        quantity=-(detail.shipped_quantity or detail.requested_quantity),
+                        transaction_type="SHIP",
+                        reference_type="Shipment",
+                        reference_idx=shipment_idx
+                    )
+                
+                # 2. 출고 상태 변경
+                shipment.status = M.ShipmentStatus.SHIPPED
+                shipment.shipped_at = datetime.now()
+                
+                # 3. 주문 상태 변경 (source가 주문인 경우)
+                if shipment.source_type == "SALES_ORDER":
+                    order = self.session.get(M.SalesOrder, shipment.source_idx)
+                    if order:
+                        order.status = M.SalesOrderStatus.SHIPPED
+                
+            elif action == "DELIVER":
+                # 1. 출고 상태 변경
+                shipment.status = M.ShipmentStatus.DELIVERED
+                shipment.delivered_at = datetime.now()
+                
+                # 2. 주문 상태 변경 (source가 주문인 경우)
+                if shipment.source_type == "SALES_ORDER":
+                    order = self.session.get(M.SalesOrder, shipment.source_idx)
+                    if order:
+                        # 모든 출고가 배송 완료인지 확인 (DB 에서 집계, 현재 출고 변경분은 autoflush 로 반영)
+                        summary = self._order_shipment_status_summary(order.idx)
+                        if summary["delivered"] == summary["total"]:
+                            order.status = M.SalesOrderStatus.DELIVERED
         
-        self.session.commit()
         self._notify_listeners(f"SHIPMENT_{action}", shipment)
         
         return {
@@ -228,24 +294,105 @@ class OrderFlowMediator:
             "message": f"출고가 {action} 처리되었습니다"
         }
     
-    def cancel_shipment(self, shipment_idx: int, reason: str = None) -> Dict[str, Any]:
-        """출고 취소"""
-        from models.ShipmentModels import Shipment, ShipmentStatus
+    def process_shipments(self, shipment_idxs: List[int], action: str) -> Dict[str, Any]:
+        """
+        여러 출고 일괄 처리 - 단일 UPDATE 로 상태 변경 후 주문 배송완료 여부를 한 번에 집계
+
+        출고(SHIPPED) 상태인 출고만 배송완료 처리하며, 취소/미출고/이미 배송완료/존재하지 않는
+        출고는 건너뛴다. 처리된 출고마다 process_shipment 와 같은 SHIPMENT_DELIVER 이벤트를 발행한다.
+        재고 트랜잭션이 필요한 SHIP 은 출고별 상세가 필요하므로 process_shipment 를 사용
+        """
+        M = self._M
+        
+        if action != "DELIVER":
+            raise ValueError(f"Batch {action} is not supported, use process_shipment")
+        
+        delivered_orders: List[int] = []
+        shipments = []
+        with self._unit_of_work():
+            # 1. 출고 상태 일괄 변경 (배송 가능한 출고만, 실제 변경된 idx 반환)
+            delivered_idxs = self.session.execute(
+                update(M.Shipment)
+                .where(
+                    M.Shipment.idx.in_(shipment_idxs),
+                    M.Shipment.status == M.ShipmentStatus.SHIPPED
+                )
+                .values(status=M.ShipmentStatus.DELIVERED, delivered_at=datetime.now())
+                .returning(M.Shipment.idx)
+            ).scalars().all()
+            
+            if delivered_idxs:
+                # 2. 관련 주문별 배송완료 여부 집계 (GROUP BY 한 번)
+                order_idxs = select(M.Shipment.source_idx).where(
+                    M.Shipment.source_type == "SALES_ORDER",
+                    M.Shipment.idx.in_(delivered_idxs)
+                )
+                rows = self.session.exec(
+                    select(
+                        M.Shipment.source_idx,
+                        func.count(),
+                        func.sum(case((M.Shipment.status == "DELIVERED", 1), else_=0)),
+                    )
+                    .where(
+                        M.Shipment.source_type == "SALES_ORDER",
+                        M.Shipment.source_idx.in_(order_idxs)
+                    )
+                    .group_by(M.Shipment.source_idx)
+                ).all()
+                delivered_orders = [
+                    order_idx for order_idx, total, delivered in rows if delivered == total
+                ]
+                
+                # 3. 주문 상태 일괄 변경
+                if delivered_orders:
+                    self.session.execute(
+                        update(M.SalesOrder)
+                        .where(M.SalesOrder.idx.in_(delivered_orders))
+                        .values(status=M.SalesOrderStatus.DELIVERED)
+                    )
+                
+                # 이벤트 전달용 출고 엔티티 (한 번에 조회)
+                shipments = self.session.exec(
+                    select(M.Shipment).where(M.Shipment.idx.in_(delivered_idxs))
+                ).all()
         
-        shipment = self.session.get(Shipment, shipment_idx)
-        if not shipment:
-            raise ValueError(f"Shipment {shipment_idx} not found")
+        for shipment in shipments:
+            self._notify_listeners(f"SHIPMENT_{action}", shipment)
         
-        # 상태 검증
-        if shipment.status in [ShipmentStatus.SHIPPED, ShipmentStatus.DELIVERED]:
-            raise ValueError(f"Cannot cancel {shipment.status} shipment")
+        return {
+            "success": True,
+            "shipment_count": len(delivered_idxs),
+            "delivered_shipments": list(delivered_idxs),
+            "delivered_orders": delivered_orders,
+            "message": f"출고 {len(delivered_idxs)}건이 {action} 처리되었습니다"
+        }
+    
+    def cancel_shipment(self, shipment_idx: int, reason: str = None) -> Dict[str, Any]:
+        """출고 취소"""
+        M = self._M
         
-        # 1. 출고 상태 변경
-        shipment.status = ShipmentStatus.CANCELLED
-        shipment.cancelled_at = datetime.now()
-        shipment.cancel_reason = reason
+        with self._unit_of_work():
+            shipment = self.session.get(M.Shipment, shipment_idx)
+            if not shipment:
+                raise ValueError(f"Shipment {shipment_idx} not found")
+            
+            # 이미 취소된 출고 (중복 요청/재시도) - 쓰기 없이 반환
+            if shipment.status == M.ShipmentStatus.CANCELLED:
+                return {
+                    "success": True,
+                    "shipment_status": shipment.status,
+                    "message": "이미 취소된 출고입니다"
+                }
+            
+            # 상태 검증
+            if shipment.status in [M.ShipmentStatus.SHIPPED, M.ShipmentStatus.DELIVERED]:
+                raise ValueError(f"Cannot cancel {shipment.status} shipment")
+            
+            # 1. 출고 상태 변경
+            shipment.status = M.ShipmentStatus.CANCELLED
+            shipment.cancelled_at = datetime.now()
+            shipment.cancel_reason = reason
         
-        self.session.commit()
         self._notify_listeners("SHIPMENT_CANCELLED", shipment)
         
         return {
@@ -256,47 +403,147 @@ class OrderFlowMediator:
     
     # ========================= 헬퍼 메서드 =========================
     
+    @contextmanager
+    def _unit_of_work(self):
+        """
+        중재자 메서드의 트랜잭션 경계
+
+        가장 바깥 호출에서만 재고 트랜잭션 flush + commit 을 1회 수행하고,
+        중첩 호출(confirm_order → create_shipment_from_order 등)은 같은 트랜잭션에 합류한다.
+        트랜잭션 중 발생한 이벤트는 큐에만 쌓이고, 롤백 시 이 트랜잭션에서 쌓인 이벤트는 폐기된다.
+        """
+        if self._uow_depth:
+            self._uow_depth += 1
+            try:
+                yield
+            finally:
+                self._uow_depth -= 1
+            return
+        
+        self._uow_depth = 1
+        queued_before = len(self._event_queue)
+        try:
+            yield
+            self._flush_inventory_transactions()
+            self.session.commit()
+        except Exception:
+            self._pending_tx_rows.clear()
+            # 롤백된 변경에 대한 이벤트 폐기 (이전부터 대기 중이던 이벤트는 유지)
+            while len(self._event_queue) > queued_before:
+                self._event_queue.pop()
+            self.session.rollback()
+            raise
+        finally:
+            self._uow_depth = 0
+    
     def _create_inventory_transaction(self, item_idx: int, quantity: float, 
                                      transaction_type: str, reference_type: str, 
                                      reference_idx: int):
-        """재고 트랜잭션 생성"""
-        from models.TransactionsModels.Item import ItemTransaction
-        
-        # 실제 구현은 TransactionModels 구조에 맞춰 조정
-        transaction = ItemTransaction(
-            item_idx=item_idx,
-            quantity=quantity,
-            status="COMPLETED",
-            # transaction_type, reference 등 추가
+        """재고 트랜잭션 생성 - _flush_inventory_transactions 호출 시 일괄 INSERT"""
+        self._pending_tx_rows.append(
+            {
+                "item_idx": item_idx,
+                "quantity": quantity,
+                **_ITEM_TRANSACTION_COLUMNS,
+            }
         )
-        self.session.add(transaction)
+    
+    def _flush_inventory_transactions(self):
+        """쌓아둔 재고 트랜잭션을 한 번의 bulk INSERT 로 저장"""
+        M = self._M
+        
+        if not self._pending_tx_rows:
+            return
+        self.session.bulk_insert_mappings(M.ItemTransaction, self._pending_tx_rows)
+        self._pending_tx_rows.clear()
     
     def _get_order_shipments(self, order_idx: int):
         """주문의 출고 목록 조회"""
-        from models.ShipmentModels import Shipment
-        
-        stmt = select(Shipment).where(
-            Shipment.source_type == "SALES_ORDER",
-            Shipment.source_idx == order_idx
-        )
-        return self.session.exec(stmt).all()
+        global _ORDER_SHIPMENTS_STMT
+        if _ORDER_SHIPMENTS_STMT is None:
+            M = self._M
+            
+            _ORDER_SHIPMENTS_STMT = select(M.Shipment).where(
+                M.Shipment.source_type == "SALES_ORDER",
+                M.Shipment.source_idx == bindparam("order_idx")
+            )
+        return self.session.exec(
+            _ORDER_SHIPMENTS_STMT, params={"order_idx": order_idx}
+        ).all()
+    
+    def _order_shipment_status_summary(self, order_idx: int) -> Dict[str, int]:
+        """주문의 출고 상태별 건수를 한 번의 집계 쿼리로 조회"""
+        M = self._M
+        
+        def count_status(status: str):
+            return func.coalesce(func.sum(case((M.Shipment.status == status, 1), else_=0)), 0)
+        
+        total, delivered, shipped, preparing = self.session.exec(
+            select(
+                func.count(),
+                count_status("DELIVERED"),
+                count_status("SHIPPED"),
+                count_status("PREPARING"),
+            ).where(
+                M.Shipment.source_type == "SALES_ORDER",
+                M.Shipment.source_idx == order_idx
+            )
+        ).one()
+        return {
+            "total": total,
+            "delivered": delivered,
+            "shipped": shipped,
+            "preparing": preparing,
+        }
+    
+    @staticmethod
+    def _summarize_shipments(shipments) -> Dict[str, int]:
+        """이미 로드한 출고 목록으로 _order_shipment_status_summary 와 같은 형태의 집계 생성"""
+        counts = Counter(s.status for s in shipments)
+        return {
+            "total": len(shipments),
+            "delivered": counts["DELIVERED"],
+            "shipped": counts["SHIPPED"],
+            "preparing": counts["PREPARING"],
+        }
     
     def _notify_listeners(self, event: str, entity: Any):
-        """리스너에게 이벤트 알림"""
-        for listener in self._listeners:
-            listener.on_event(event, entity)
+        """
+        리스너에게 이벤트 알림
+
+        리스너가 다시 중재자 메서드를 호출해 발생한 이벤트는 큐에만 넣고 반환하며,
+        가장 바깥 호출이 큐를 순서대로 비운다 (재귀 대신 평탄한 반복).
+        _unit_of_work 진행 중(중첩 호출)에는 큐에만 넣고, 바깥 커밋 후 알림에서 함께 전달한다.
+        """
+        self._event_queue.append((event, entity))
+        if self._dispatching or self._uow_depth:
+            return
+        
+        self._dispatching = True
+        try:
+            while self._event_queue:
+                queued_event, queued_entity = self._event_queue.popleft()
+                for callback in self._on_event_callbacks:
+                    callback(queued_event, queued_entity)
+        except BaseException:
+            # 실패한 펌프의 남은 이벤트가 다음 무관한 알림에 섞여 전달되지 않도록 폐기
+            self._event_queue.clear()
+            raise
+        finally:
+            self._dispatching = False
     
     def register_listener(self, listener):
         """리스너 등록"""
-        self._listeners.append(listener)
+        self._listeners = (*self._listeners, listener)
+        self._on_event_callbacks = (*self._on_event_callbacks, listener.on_event)
     
     # ========================= 조회 메서드 =========================
     
     def get_order_full_status(self, order_idx: int) -> Dict[str, Any]:
         """주문의 전체 상태 조회"""
-        from models.SalesModels import SalesOrder
+        M = self._M
         
-        order = self.session.get(SalesOrder, order_idx)
+        order = self.session.get(M.SalesOrder, order_idx)
         if not order:
             return None
         
@@ -317,27 +564,26 @@ class OrderFlowMediator:
                 }
                 for s in shipments
             ],
-            "display_status": self._calculate_display_status(order, shipments),
+            "display_status": self._calculate_display_status(
+                order, self._summarize_shipments(shipments)
+            ),
             "available_actions": self._get_available_actions(order, shipments)
         }
     
-    def _calculate_display_status(self, order, shipments) -> str:
-        """고객 화면용 통합 상태 계산"""
+    def _calculate_display_status(self, order, summary: Dict[str, int]) -> str:
+        """고객 화면용 통합 상태 계산 (summary: 출고 상태별 건수 집계)"""
         if order.status == "CANCELLED":
             return "주문취소"
-        elif not shipments:
+        elif not summary["total"]:
             if order.status == "CONFIRMED":
                 return "결제완료"
             else:
                 return "주문접수"
-        elif all(s.status == "DELIVERED" for s in shipments):
-            return "배송완료"
-        elif any(s.status == "SHIPPED" for s in shipments):
-            return "배송중"
-        elif any(s.status == "PREPARING" for s in shipments):
-            return "상품준비중"
-        else:
-            return "출고대기"
+        
+        for predicate, label in _DISPLAY_RULES:
+            if predicate(summary):
+                return label
+        return "출고대기"
     
     def _get_available_actions(self, order, shipments) -> List[str]:
         """현재 상태에서 가능한 액션"""
@@ -5,7 +5,7 @@
 """
 
 from types import NoneType
-from typing import Optional, Set, TypeVar, Generic, List, Type, Any, Dict
+from typing import Optional, Set, FrozenSet, TypeVar, Generic, List, Literal, Type, Any, Dict, Tuple
 from enum import Enum
 from fastapi import HTTPException
 
@@ -47,6 +47,13 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
     allowed_transitions: 상태 전이 규칙
     entry_points: 진입 가능점
 
+    전이 규칙은 클래스 속성 ALLOWED_TRANSITIONS 로 선언하는 것을 권장
+    (메타클래스가 인스턴스를 만들지 않고 바로 등록할 수 있음)
+
+    예시:
+        class BuyStateMachine(StateMachine[BuyStatus]):
+            ALLOWED_TRANSITIONS = {BuyStatus.PENDING: {BuyStatus.DONE}, BuyStatus.DONE: set()}
+
     """
 
     def __init__(
@@ -56,10 +63,26 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
         order: Dict[StateType, int] = {},
         
     ):
-        self.ALLOWED_TRANSITIONS: Dict[StateType, Set[StateType]] = allowed_transitions
-        self.ENTRY_POINTS: Set[StateType] = (
-            entry_points if entry_points else set(self.ALLOWED_TRANSITIONS.keys())
+        if not allowed_transitions:
+            # 클래스 속성으로 선언된 전이 규칙 사용
+            allowed_transitions = getattr(type(self), "ALLOWED_TRANSITIONS", {})
+
+        # 전이 대상은 frozenset 으로 고정 (조회 시 빈 set 할당 방지)
+        self.ALLOWED_TRANSITIONS: Dict[StateType, FrozenSet[StateType]] = {
+            from_state: frozenset(to_states)
+            for from_state, to_states in allowed_transitions.items()
+        }
+        self._EMPTY: FrozenSet[StateType] = frozenset()
+        # can_transition 용 (from, to) 쌍 집합
+        self._ALL_TRANSITIONS_FLAT: Set[Tuple[StateType, StateType]] = {
+            (from_state, to_state)
+            for from_state, to_states in self.ALLOWED_TRANSITIONS.items()
+            for to_state in to_states
+        }
+        self.ENTRY_POINTS: FrozenSet[StateType] = frozenset(
+            entry_points if entry_points else self.ALLOWED_TRANSITIONS.keys()
         )
+        self._ENTRY_POINTS_LIST: List[StateType] = list(self.ENTRY_POINTS)
         self.ORDER: Dict[StateType, int] = (
             order
             if order
@@ -69,6 +92,17 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
             }
         )
         self.states = list[StateType](self.ALLOWED_TRANSITIONS.keys())
+        # get_next_allowed_states 용: 상태별 (ORDER 순 전이 가능 상태..., 자기 자신)
+        self._NEXT_ALLOWED_WITH_SELF: Dict[StateType, Tuple[StateType, ...]] = {
+            state: (*sorted(allowed, key=lambda s: self.ORDER.get(s, 0)), state)
+            for state, allowed in self.ALLOWED_TRANSITIONS.items()
+        }
+
+        # create_model 결과 캐시 (ALLOWED_TRANSITIONS / ORDER 는 생성 후 변하지 않음)
+        self._transition_model: Optional[Type[BaseModel]] = None
+        self._order_model: Optional[Type[BaseModel]] = None
+        self._machine_info: Optional[Type[BaseModel]] = None
+        self._transition_map: Optional[Dict[str, Any]] = None
 
     def can_initialize(self, status: StateType) -> bool:
         """
@@ -90,13 +124,11 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
         Returns:
             전이 가능 여부
         """
-        # 동일 상태로의 전이는 허용 (멱등성)
-        if from_status == to_status:
-            return True
-
-        # 기본 전이 규칙 체크
-        allowed_states = self.ALLOWED_TRANSITIONS.get(from_status, set())
-        return to_status in allowed_states
+        # 동일 상태로의 전이는 허용 (멱등성) + 기본 전이 규칙 체크
+        return (
+            from_status == to_status
+            or (from_status, to_status) in self._ALL_TRANSITIONS_FLAT
+        )
 
     def validate_transition(self, from_status: StateType, to_status: StateType) -> None:
         """
@@ -110,7 +142,7 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
             HTTPException: 잘못된 상태 전이인 경우
         """
         if not self.can_transition(from_status, to_status):
-            allowed_states = self.ALLOWED_TRANSITIONS.get(from_status, set())
+            allowed_states = self.ALLOWED_TRANSITIONS.get(from_status, self._EMPTY)
             allowed_names = [s.value for s in allowed_states]
             raise HTTPException(
                 status_code=400,
@@ -129,10 +161,8 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
             전이 가능한 상태 목록
         """
         if not current_status:
-            return list(self.ENTRY_POINTS)
-        allowed_states = self.ALLOWED_TRANSITIONS.get(current_status, set()) 
-        allowed_states = list(allowed_states) +  [current_status]
-        return allowed_states
+            return self._ENTRY_POINTS_LIST
+        return list(self._NEXT_ALLOWED_WITH_SELF.get(current_status, (current_status,)))
 
     def get_transition_reason(
         self, from_status: StateType, to_status: StateType
@@ -145,13 +175,19 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
         return f"{from_status.value} → {to_status.value}"
 
     def get_transition_model(self) -> Type[BaseModel]:
+        """전이 규칙 BaseModel 반환 (최초 1회 생성 후 캐시)"""
+        if self._transition_model is None:
+            self._transition_model = self._build_transition_model()
+        return self._transition_model
+
+    def _build_transition_model(self) -> Type[BaseModel]:
         """
         동적으로 전이 규칙 BaseModel 생성
-        각 상태별 다음 가능한 상태들을 List[Enum]로 표현
+        각 상태별 다음 가능한 상태들을 List[Literal[...]]로 표현
 
         예시:
-        - 대기중: [Enum('처리중'), Enum('취소됨')]
-        - 처리중: [Enum('입고중'), Enum('보류'), Enum('취소됨')]
+        - 대기중: [Literal['처리중', '취소됨']]
+        - 처리중: [Literal['입고중', '보류', '취소됨']]
         - 입고중: [] (전이 불가능)
         - 취소됨: [] (전이 불가능)
         """
@@ -164,19 +200,12 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
             allowed_values = [s.value for s in allowed]
 
             if allowed_values:
-                # 동적 Enum 생성: 각 상태별로 다른 Enum 클래스 생성 (set → list로 변환하여 순서 고정)
-                sorted_allowed_values = list(sorted(set(allowed_values)))
-                DynamicEnum = Enum(
-                    f"TransitionEnum_{field_name}",
-                    {val: val for val in sorted_allowed_values},
-                    type=str,
-                )
-                # default는 DynamicEnum의 모든 값들
+                # 상태별 Enum 클래스 대신 Literal 사용 (set → 정렬하여 순서 고정)
+                sorted_allowed_values = tuple(sorted(set(allowed_values)))
+                # default는 허용된 모든 값들
                 fields[field_name] = (
-                    List[DynamicEnum],
-                    Field(
-                        default=[getattr(DynamicEnum, val) for val in allowed_values]
-                    ),
+                    List[Literal[sorted_allowed_values]],  # type: ignore[valid-type]
+                    Field(default=list(allowed_values)),
                 )
             else:
                 # 전이 불가능한 상태 (빈 리스트)
@@ -189,6 +218,12 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
         return TransitionModel
 
     def get_order_model(self) -> Type[BaseModel]:
+        """상태별 순서 BaseModel 반환 (최초 1회 생성 후 캐시)"""
+        if self._order_model is None:
+            self._order_model = self._build_order_model()
+        return self._order_model
+
+    def _build_order_model(self) -> Type[BaseModel]:
         """
         상태별 순서를 Pydantic 모델로 반환
 
@@ -209,6 +244,12 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
         return OrderModel
 
     def get_machine_info(self) -> Type[BaseModel]:
+        """머신 정보 BaseModel 반환 (최초 1회 생성 후 캐시)"""
+        if self._machine_info is None:
+            self._machine_info = self._build_machine_info()
+        return self._machine_info
+
+    def _build_machine_info(self) -> Type[BaseModel]:
         """
         머신 정보를 Pydantic 모델로 반환
 
@@ -259,17 +300,19 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
             ),
             entry_points=(
                 List[StateType],
-                Field(default=list[StateType](self.ENTRY_POINTS)),
+                Field(default=self._ENTRY_POINTS_LIST),
             ),
         )
         return StateMachineInfo
 
     @property
     def transition_model(self) -> Type[BaseModel]:
-        return self.get_transition_model()
+        if self._transition_model is None:
+            self._transition_model = self._build_transition_model()
+        return self._transition_model
 
     @property
-    def entry_points(self) -> Set[StateType]:
+    def entry_points(self) -> FrozenSet[StateType]:
         return self.ENTRY_POINTS
 
     @property
@@ -277,6 +320,17 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
         return self.__class__.__name__
 
     def to_transition_map(self) -> Dict[str, Any]:
+        """상태 전이 정보 반환 (인스턴스의 ALLOWED_TRANSITIONS 기준, 최초 호출 시 생성)"""
+        if self._transition_map is None:
+            self._transition_map = self._build_transition_map()
+        return self._transition_map
+
+    def _build_transition_map(self) -> Dict[str, Any]:
+        """현재 인스턴스의 ALLOWED_TRANSITIONS 로 전이 맵 생성"""
+        return self._transition_map_from(self.ALLOWED_TRANSITIONS)
+
+    @staticmethod
+    def _transition_map_from(allowed_transitions: Dict[Any, Any]) -> Dict[str, Any]:
         """
         상태 전이 정보를 딕셔너리로 변환
 
@@ -298,34 +352,22 @@ class StateMachine(Generic[StateType], metaclass=StateMachineMeta):
                 }
             }
         """
-        transitions = []
-        enum_map = {}
-
-        for from_status, to_statuses in self.ALLOWED_TRANSITIONS.items():
-            # Enum name과 value 추출
-            from_status_code = from_status.name
-            from_status_value = from_status.value
-
-            # enum_map에 등록
-            enum_map[from_status_code] = from_status_value
-
-            # 다음 상태들 추출
-            to_statuses_values = [s.value for s in to_statuses]
-            to_status_codes = [s.name for s in to_statuses]
-
-            # enum_map에 다음 상태들도 등록
-            for status in to_statuses:
-                if status.name not in enum_map:
-                    enum_map[status.name] = status.value
-
-            transitions.append(
-                {
-                    "from_status": from_status_value,
-                    "from_status_code": from_status_code,
-                    "to_statuses": to_statuses_values,
-                    "to_status_codes": to_status_codes,
-                }
-            )
+        # 출발/도착 상태 전체를 한 번에 enum_map 으로 변환 (중복 키는 dict 가 정리)
+        all_states = [
+            *allowed_transitions,
+            *(to_status for to_statuses in allowed_transitions.values() for to_status in to_statuses),
+        ]
+        enum_map = {status.name: status.value for status in all_states}
+
+        transitions = [
+            {
+                "from_status": from_status.value,
+                "from_status_code": from_status.name,
+                "to_statuses": [s.value for s in to_statuses],
+                "to_status_codes": [s.name for s in to_statuses],
+            }
+            for from_status, to_statuses in allowed_transitions.items()
+        ]
 
         return {"transitions": transitions, "enum_map": enum_map}
 
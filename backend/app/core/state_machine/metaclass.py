@@ -2,14 +2,29 @@
 상태 머신 메타클래스 - 자동 등록
 """
 
+import inspect
 import logging
-from typing import Type, cast, TYPE_CHECKING
+from typing import Any, Dict, Optional, Type, cast, TYPE_CHECKING
 
 from .registry import StateMachineRegistry
 
 if TYPE_CHECKING:
     from .base import StateMachine
 
+# 베이스 StateMachine 클래스 (생성 시점에 1회 기록, 이후 issubclass 판별에 사용)
+_STATE_MACHINE_CLS: Optional[type] = None
+
+
+def _from_init_default(cls: type) -> Optional[Dict[Any, Any]]:
+    """__init__ 의 allowed_transitions 기본값 추출 (선언되어 있지 않으면 None)"""
+    try:
+        parameter = inspect.signature(cls.__init__).parameters.get("allowed_transitions")
+    except (TypeError, ValueError):
+        return None
+    if parameter is None or parameter.default is inspect.Parameter.empty:
+        return None
+    return parameter.default or None
+
 
 class StateMachineMeta(type):
     """상태 머신 메타클래스 - 자동 등록"""
@@ -18,21 +33,26 @@ class StateMachineMeta(type):
     logger.setLevel(logging.INFO)
 
     def __new__(mcs, name, bases, namespace):
+        global _STATE_MACHINE_CLS
         cls = super().__new__(mcs, name, bases, namespace)
         mcs.logger.debug(f"StateMachineMeta __new__: {name} {bases}")
 
-        # StateMachine을 상속받는 클래스만 등록 (클래스 이름으로 확인)
-        if bases and any(base.__name__ == "StateMachine" for base in bases):
-            # 등록 전에 인스턴스 생성해서 allowed_transitions 추출
-            allowed_transitions = {}
-            try:
-                temp_instance: StateMachine = cls()
-                if hasattr(temp_instance, "ALLOWED_TRANSITIONS"):
-                    allowed_transitions = temp_instance.ALLOWED_TRANSITIONS
-                else:
-                    mcs.logger.warning(f"{name} has no ALLOWED_TRANSITIONS attribute")
-            except Exception as e:
-                mcs.logger.error(f"Failed to initialize {name}: {e}")
+        # 베이스 클래스 자체는 기록만 하고 등록하지 않음
+        if _STATE_MACHINE_CLS is None and name == "StateMachine":
+            _STATE_MACHINE_CLS = cls
+            return cls
+
+        # StateMachine을 상속받는 클래스만 등록
+        if _STATE_MACHINE_CLS is not None and issubclass(cls, _STATE_MACHINE_CLS):
+            # 인스턴스를 만들지 않고 클래스 속성 / __init__ 기본값에서 전이 규칙 추출
+            allowed_transitions = getattr(cls, "ALLOWED_TRANSITIONS", None) or _from_init_default(cls)
+            if allowed_transitions is None:
+                # __init__ 본문에서 전이 규칙을 넘기는 기존 방식 호환
+                try:
+                    allowed_transitions = cls().ALLOWED_TRANSITIONS
+                except TypeError as e:
+                    mcs.logger.warning(f"{name} has no ALLOWED_TRANSITIONS: {e}")
+                    allowed_transitions = {}
 
             # name, cls, allowed_transitions 함께 등록
             StateMachineRegistry.register(
@@ -44,4 +64,3 @@ class StateMachineMeta(type):
             mcs.logger.debug(transition_log)
 
         return cls
-
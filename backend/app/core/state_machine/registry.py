@@ -1,148 +1,201 @@
 """
 상태 머신 레지스트리 - 등록된 상태 머신 관리
+
+레지스트리 상태는 모듈 전역 dict 에 두고 모듈 함수로 조작한다.
+StateMachineRegistry 는 기존 호출부 호환용 파사드.
 """
 
-from typing import Any, Dict, Type, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, Tuple, Type, Optional, TYPE_CHECKING, Union
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from .base import StateMachine
 
 
-class StateMachineRegistry:
-    """상태 머신 레지스트리 - 모듈 레벨 싱글톤"""
-
-    _machines: Dict[str, Dict[str, Any]] = {}  # name -> {class, allowed_transitions}
-    _transition_models_cache: Dict[str, Type[BaseModel]] = (
-        {}
-    )  # 캐싱: machine_name -> BaseModel
-    # _machine_info_cache: Dict[str, Type[BaseModel]] = (
-    #     {}
-    # ) # 캐싱: machine_name -> BaseModel
-    @classmethod
-    def register(
-        cls,
-        name: str,
-        machine_class: Type["StateMachine"],
-        allowed_transitions: Optional[Dict] = None,
-    ):
-        """상태 머신 등록"""
-        cls._machines[name] = {
-            "class": machine_class,
-            "allowed_transitions": allowed_transitions or {},
-        }
-
-    @classmethod
-    def get_machine(cls, name: str) -> Optional[Type["StateMachine"]]:
-        """상태 머신 조회"""
-        machine_info = cls._machines.get(name)
-        return machine_info["class"] if machine_info else None
-
-    @classmethod
-    def get_allowed_transitions(cls, name: str) -> Optional[Dict]:
-        """상태 머신의 allowed_transitions 조회"""
-        machine_info = cls._machines.get(name)
-        return machine_info["allowed_transitions"] if machine_info else None
-
-    @classmethod
-    def get_all_machines(cls) -> Dict[str, Type["StateMachine"]]:
-        """모든 상태 머신 조회"""
-        return {name: info["class"] for name, info in cls._machines.items()}
-
-    @classmethod
-    def get_machine_by_state(cls, state) -> Optional[Type["StateMachine"]]:
-        """상태로 머신 조회"""
-        for name, info in cls._machines.items():
-            if state in info["allowed_transitions"]:
-                return info["class"]
-        return None
-
-    @classmethod
-    def get_transition_model(cls, machine_name: str) -> Type[BaseModel]:
-        """
-        등록된 상태머신의 transition BaseModel을 반환
-
-        Args:
-            machine_name: 상태머신 이름 (클래스 이름, 예: 'BuyStateMachine')
-
-        Returns:
-            Pydantic BaseModel 클래스
-
-        Raises:
-            ValueError: 머신이 등록되지 않았거나 모델 생성에 실패한 경우
-
-        예시:
-            response_model=StateMachineRegistry.get_transition_model('BuyStateMachine')
-        """
-        # 캐시에서 먼저 확인
-        if machine_name in cls._transition_models_cache:
-            return cls._transition_models_cache[machine_name]
-
-        # 등록된 머신 조회
-        machine_class = cls.get_machine(machine_name)
-        if not machine_class:
-            raise ValueError(f"StateMachine '{machine_name}'이 등록되지 않았습니다.")
-
-        # 인스턴스 생성하여 BaseModel 생성
-        try:
-            instance: StateMachine = machine_class()
-            model = instance.get_transition_model()
-            # 캐시에 저장
-            cls._transition_models_cache[machine_name] = model
-            return model
-        except Exception as e:
-            raise ValueError(f"'{machine_name}'의 transition model 생성 실패: {e}")
-
-    @classmethod
-    def get_machine_info(cls,machine_name:Union[str, Type["StateMachine"]]) -> Type[BaseModel]:
-        if isinstance(machine_name, type) :
-            machine_name = machine_name.__name__
-        """
-        등록된 상태머신의 machine info BaseModel을 반환
-
-        Args:
-            machine_name: 상태머신 이름 (클래스 이름, 예: 'BuyStateMachine')
-
-        Returns:
-            Pydantic BaseModel 클래스
-
-        Raises:
-            ValueError: 머신이 등록되지 않았거나 모델 생성에 실패한 경우
-
-        예시:
-            response_model=StateMachineRegistry.get_transition_model('BuyStateMachine')
-        """
-        # if machine_name in cls._machine_info_cache:
-        #     return cls._machine_info_cache[machine_name]
-        machine_class = cls.get_machine(machine_name)
-        if not machine_class:
-            raise ValueError(f"StateMachine '{machine_name}'이 등록되지 않았습니다.")
+_machines: Dict[str, Dict[str, Any]] = {}  # name -> {class, allowed_transitions}
+_transition_models_cache: Dict[str, Type[BaseModel]] = (
+    {}
+)  # 캐싱: machine_name -> BaseModel
+_machine_info_cache: Dict[str, Type[BaseModel]] = (
+    {}
+)  # 캐싱: machine_name -> BaseModel
+_state_to_machine: Dict[Any, Type["StateMachine"]] = (
+    {}
+)  # 역인덱스: state -> machine_class (먼저 등록된 머신 우선)
+
+
+def register(
+    name: str,
+    machine_class: Type["StateMachine"],
+    allowed_transitions: Optional[Dict] = None,
+):
+    """상태 머신 등록"""
+    # 재등록 시 이전 클래스가 차지하던 역인덱스 항목 제거
+    previous = _machines.get(name)
+    if previous is not None:
+        for state in previous["allowed_transitions"]:
+            if _state_to_machine.get(state) is previous["class"]:
+                del _state_to_machine[state]
+    _machines[name] = {
+        "class": machine_class,
+        "allowed_transitions": allowed_transitions or {},
+    }
+    # 재등록 시 이전 클래스 기준으로 만들어진 캐시 무효화
+    _transition_models_cache.pop(name, None)
+    _machine_info_cache.pop(name, None)
+    for state in allowed_transitions or {}:
+        _state_to_machine.setdefault(state, machine_class)
+
+
+def get_machine(name: str) -> Optional[Type["StateMachine"]]:
+    """상태 머신 조회"""
+    machine_info = _machines.get(name)
+    return machine_info["class"] if machine_info else None
+
+
+def get_allowed_transitions(name: str) -> Optional[Dict]:
+    """상태 머신의 allowed_transitions 조회"""
+    machine_info = _machines.get(name)
+    return machine_info["allowed_transitions"] if machine_info else None
+
+
+def get_all_machines() -> Dict[str, Type["StateMachine"]]:
+    """모든 상태 머신 조회"""
+    return {name: info["class"] for name, info in _machines.items()}
+
+
+def get_machine_by_state(state) -> Optional[Type["StateMachine"]]:
+    """상태로 머신 조회"""
+    return _state_to_machine.get(state)
+
+
+def _resolve_machine_class(
+    name_or_cls: Union[str, Type["StateMachine"]],
+) -> Tuple[str, Type["StateMachine"]]:
+    """
+    이름 또는 클래스를 (캐시 키로 쓰는 이름, 머신 클래스)로 변환
+
+    클래스가 주어지면 이름 조회 없이 그대로 사용한다 (등록 이름 == 클래스 이름).
+    """
+    if isinstance(name_or_cls, type):
+        return name_or_cls.__name__, name_or_cls
+    machine_class = get_machine(name_or_cls)
+    if not machine_class:
+        raise ValueError(f"StateMachine '{name_or_cls}'이 등록되지 않았습니다.")
+    return name_or_cls, machine_class
+
+
+def get_transition_model(machine_name: Union[str, Type["StateMachine"]]) -> Type[BaseModel]:
+    """
+    등록된 상태머신의 transition BaseModel을 반환
+
+    Args:
+        machine_name: 상태머신 이름 (클래스 이름, 예: 'BuyStateMachine') 또는 클래스
+
+    Returns:
+        Pydantic BaseModel 클래스
+
+    Raises:
+        ValueError: 머신이 등록되지 않았거나 모델 생성에 실패한 경우
+
+    예시:
+        response_model=StateMachineRegistry.get_transition_model('BuyStateMachine')
+    """
+    # 캐시에서 먼저 확인
+    key = machine_name.__name__ if isinstance(machine_name, type) else machine_name
+    hit = _transition_models_cache.get(key)
+    if hit is not None:
+        return hit
+
+    # 클래스가 주어지면 이름 조회 생략
+    machine_name, machine_class = _resolve_machine_class(machine_name)
+
+    # 인스턴스 생성하여 BaseModel 생성
+    try:
         instance: StateMachine = machine_class()
-        model = instance.get_machine_info()
-        # cls._machine_info_cache[machine_name] = model
+        model = instance.get_transition_model()
+        # 캐시에 저장
+        _transition_models_cache[machine_name] = model
         return model
-    @classmethod
-    def print_transitions(cls, name: Optional[str] = None) -> str:
-        """상태 머신의 전이 규칙을 한글로 번역해서 반환"""
-        if name is None:
-            return "\n".join(
-                [cls.print_transitions(name) for name in cls._machines.keys()]
-            )
-        machine_info = cls._machines.get(name)
+    except Exception as e:
+        raise ValueError(f"'{machine_name}'의 transition model 생성 실패: {e}")
+
+
+def get_machine_info(machine_name: Union[str, Type["StateMachine"]]) -> Type[BaseModel]:
+    """
+    등록된 상태머신의 machine info BaseModel을 반환
+
+    Args:
+        machine_name: 상태머신 이름 (클래스 이름, 예: 'BuyStateMachine') 또는 클래스
+
+    Returns:
+        Pydantic BaseModel 클래스
+
+    Raises:
+        ValueError: 머신이 등록되지 않았거나 모델 생성에 실패한 경우
+
+    예시:
+        response_model=StateMachineRegistry.get_transition_model('BuyStateMachine')
+    """
+    # 캐시에서 먼저 확인
+    key = machine_name.__name__ if isinstance(machine_name, type) else machine_name
+    hit = _machine_info_cache.get(key)
+    if hit is not None:
+        return hit
+    machine_name, machine_class = _resolve_machine_class(machine_name)
+    instance: StateMachine = machine_class()
+    model = instance.get_machine_info()
+    _machine_info_cache[machine_name] = model
+    return model
+
+
+def clear_cache():
+    """transition model / machine info 캐시 초기화 (테스트 teardown 용)"""
+    _transition_models_cache.clear()
+    _machine_info_cache.clear()
+
+
+def print_transitions(name: Optional[str] = None) -> str:
+    """상태 머신의 전이 규칙을 한글로 번역해서 반환"""
+
+    def _lines(name: str):
+        machine_info = _machines.get(name)
         if not machine_info:
-            return f"상태 머신 '{name}'을 찾을 수 없습니다."
+            yield f"상태 머신 '{name}'을 찾을 수 없습니다."
+            return
 
         allowed_transitions = machine_info["allowed_transitions"]
         if not allowed_transitions:
-            return f"상태 머신 '{name}'에 전이 규칙이 없습니다."
+            yield f"상태 머신 '{name}'에 전이 규칙이 없습니다."
+            return
 
-        result = [f"상태 전이 규칙: {name}"]
+        yield f"상태 전이 규칙: {name}"
         for from_state, to_states in allowed_transitions.items():
             if to_states:
-                to_state_names = [s.value for s in to_states]
-                result.append(f"  -{from_state.value} → {', '.join(to_state_names)}")
+                yield f"  -{from_state.value} → {', '.join(s.value for s in to_states)}"
             else:
-                result.append(f"  -{from_state.value} → 변경 불가 (최종 상태)")
+                yield f"  -{from_state.value} → 변경 불가 (최종 상태)"
+
+    if name is None:
+        return "\n".join(line for name in _machines for line in _lines(name))
+    return "\n".join(_lines(name))
 
-        return "\n".join(result)
 
+class StateMachineRegistry:
+    """상태 머신 레지스트리 - 모듈 함수에 위임하는 파사드"""
+
+    # 모듈 전역 dict 와 같은 객체 (기존 cls._machines 접근 호환)
+    _machines = _machines
+    _transition_models_cache = _transition_models_cache
+    _machine_info_cache = _machine_info_cache
+    _state_to_machine = _state_to_machine
+
+    register = staticmethod(register)
+    get_machine = staticmethod(get_machine)
+    get_allowed_transitions = staticmethod(get_allowed_transitions)
+    get_all_machines = staticmethod(get_all_machines)
+    get_machine_by_state = staticmethod(get_machine_by_state)
+    get_transition_model = staticmethod(get_transition_model)
+    get_machine_info = staticmethod(get_machine_info)
+    clear_cache = staticmethod(clear_cache)
+    print_transitions = staticmethod(print_transitions)
@@ -7,6 +7,7 @@ from app.api.main import api_router
 from app.core.config import settings
 import uvicorn
 from app.core.internal.utils.utils import regist_all_routers
+from app.services.directsend import close_services as close_directsend_services
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -28,24 +29,26 @@ app = FastAPI(
     },
 )
 
+# 로컬/사내망 개발 서버 origin (포트 무관)
+LOCAL_ORIGIN_REGEX = r"http://(localhost|127\.0\.0\.1|192\.168\.0\.129):\d+"
+
+# 설정된 origin(BACKEND_CORS_ORIGINS + FRONTEND_HOST)은 정확히 일치 비교,
+# 그 외에는 개발용 regex 만 허용 ("*" 와일드카드는 credentials 와 함께 쓰지 않음)
 app.add_middleware(
-CORSMiddleware,
-    allow_origins=["*"],
-    allow_origin_regex=r"http://(localhost|127\.0\.0\.1|192\.168\.0\.129):\d+",
+    CORSMiddleware,
+    allow_origins=settings.all_cors_origins,
+    allow_origin_regex=LOCAL_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
     expose_headers=["*"],  # 응답 헤더도 노출
 )
-# Set all CORS enabled origins
-# if settings.all_cors_origins:
-#     app.add_middleware(
-#         CORSMiddleware,
-#         allow_origins=settings.all_cors_origins,
-#         allow_credentials=True,
-#         allow_methods=["*"],
-#         allow_headers=["*"],
-#     )
+
+
+@app.on_event("shutdown")
+async def close_directsend_clients() -> None:
+    await close_directsend_services()
+
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 regist_all_routers(app,base_dir="app/api",pattern=r"routes\.py$")
@@ -1,6 +1,6 @@
 import datetime
 from uuid import UUID, uuid4
-from sqlmodel import JSON, Column, Field, SQLModel, Relationship
+from sqlmodel import JSON, Column, Field, SQLModel, Relationship, text
 from typing import Any, Dict, List, Optional
 from enum import Enum
 
@@ -20,8 +20,8 @@ class FormBase(SQLModel):
     category: str = Field(min_length=1, max_length=255)
     title: str = Field(min_length=1, max_length=255)
     description: str | None = Field(default=None, max_length=255)
-    JSONSchema: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    UISchema: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    JSONSchema: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    UISchema: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
     Theme: str = Field(default="mui")
     useYN: bool = Field(default=True)
     # 배포 관련 메타데이터
@@ -47,7 +47,10 @@ class FormPublishBase(SQLModel):
     receiver: str = Field(max_length=255)  # 이메일 또는 전화번호
     receiver_name: str | None = Field(default=None, max_length=100)  # 수신자 이름
     token: str = Field(max_length=64, unique=True, index=True)  # 접근 토큰
-    expired_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now() + datetime.timedelta(days=30))
+    # 만료 시각은 DB 시계 기준 (미지정 시 생성 시각 + 30일, 만료 비교도 DB 에서 수행)
+    expired_at: datetime.datetime = Field(
+        sa_column_kwargs={"server_default": text("LOCALTIMESTAMP + interval '30 days'")},
+    )
     # 이메일 전송 관련
     is_email_sent: bool = Field(default=False)  # 이메일 전송 여부
     email_sent_at: datetime.datetime | None = Field(default=None)  # 이메일 전송 시간
@@ -55,7 +58,7 @@ class FormPublishBase(SQLModel):
     # 응답 관련
     is_submitted: bool = Field(default=False)  # 제출 여부
     submitted_at: datetime.datetime | None = Field(default=None)  # 제출 시간
-    responseSchema: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    responseSchema: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
 
 
 class FormPublishTemplate(FormPublishBase, Base): 
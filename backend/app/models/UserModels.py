@@ -1,5 +1,5 @@
 from typing import List, Optional
-from pydantic import EmailStr
+from pydantic import ConfigDict, EmailStr
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 from passlib.context import CryptContext
@@ -7,12 +7,16 @@ from passlib.context import CryptContext
 from app.core.model import Base
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 스킴이 bcrypt 하나뿐이므로 핸들러를 직접 사용 (호출마다 스킴 조회 생략)
+_bcrypt_hasher = pwd_context.handler("bcrypt")
 
 
 # ============ 요청 스키마 ============
 
 class UserRegister(SQLModel):
     """회원가입 요청"""
+    model_config = ConfigDict(defer_build=True)
+
     user_id: str = Field(min_length=4, max_length=50)
     plain_password: str = Field(min_length=8, max_length=40)
     email: EmailStr
@@ -21,6 +25,8 @@ class UserRegister(SQLModel):
 
 class UserUpdate(SQLModel):
     """유저 정보 수정 요청 (관리자용)"""
+    model_config = ConfigDict(defer_build=True)
+
     email: EmailStr | None = None
     name: str | None = Field(default=None, max_length=100)
     useYN: bool | None = None
@@ -29,12 +35,16 @@ class UserUpdate(SQLModel):
 
 class UserUpdateMe(SQLModel):
     """본인 정보 수정 요청"""
+    model_config = ConfigDict(defer_build=True)
+
     email: EmailStr | None = None
     name: str | None = Field(default=None, max_length=100)
 
 
 class UpdatePassword(SQLModel):
     """비밀번호 변경 요청"""
+    model_config = ConfigDict(defer_build=True)
+
     current_password: str = Field(min_length=8, max_length=40)
     new_password: str = Field(min_length=8, max_length=40)
 
@@ -57,16 +67,16 @@ class User(UserBase, Base, table=True):
     def from_register(cls, register: UserRegister):
         """UserRegister로부터 User 생성"""
         user_data = register.model_dump(exclude={"plain_password"})
-        user_data["hashed_password"] = pwd_context.hash(register.plain_password)
+        user_data["hashed_password"] = _bcrypt_hasher.hash(register.plain_password)
         return cls(**user_data)
     
     # def verify_password(self, plain_password: str) -> bool:
     #     """비밀번호 검증"""
-    #     return pwd_context.verify(plain_password, self.hashed_password)
+    #     return _bcrypt_hasher.verify(plain_password, self.hashed_password)
     
     # def set_password(self, plain_password: str) -> None:
     #     """비밀번호 설정"""
-    #     self.hashed_password = pwd_context.hash(plain_password)
+    #     self.hashed_password = _bcrypt_hasher.hash(plain_password)
 
 
 # ============ 응답 스키마 ============
@@ -1,14 +1,5 @@
-from os.path import dirname, basename, isfile, join
-import glob
-
-# 현재 디렉토리의 모든 .py 파일을 가져옴
-modules = glob.glob(join(dirname(__file__), "*.py"))
-
-# __init__.py를 제외한 모든 .py 파일들
-__all__ = [
-    basename(f)[:-3] for f in modules
-    if isfile(f) and not f.endswith('__init__.py')
-]
+# 모델 모듈 목록 (새 모델 파일 추가 시 여기와 아래 import 에 함께 등록)
+__all__ = ["FormModels", "UserModels"]
 
 from .FormModels import *
 from .UserModels import *
@@ -1,4 +1,15 @@
-from app.services.directsend import DirectSendMailService, DirectSendSMSService
-
-__all__ = ["DirectSendMailService", "DirectSendSMSService"]
+from app.services.directsend import (
+    DirectSendMailService,
+    DirectSendSMSService,
+    close_services,
+    get_mail_service,
+    get_sms_service,
+)
 
+__all__ = [
+    "DirectSendMailService",
+    "DirectSendSMSService",
+    "close_services",
+    "get_mail_service",
+    "get_sms_service",
+]
@@ -3,15 +3,21 @@ DirectSend API Service Layer
 메일 및 SMS 발송 서비스
 """
 
+import asyncio
+from functools import lru_cache
+
 import httpx
+from orjson import dumps as _json_dumps, loads as _json_loads
 from typing import Any
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 
 from app.core.config import settings
 
 
 class MailReceiver(BaseModel):
     """메일 수신자 정보"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid", strict=True)
+    
     name: str
     email: EmailStr
     note1: str = ""
@@ -23,6 +29,8 @@ class MailReceiver(BaseModel):
 
 class SMSReceiver(BaseModel):
     """SMS 수신자 정보"""
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid", strict=True)
+    
     name: str
     mobile: str
     note1: str = ""
@@ -32,8 +40,15 @@ class SMSReceiver(BaseModel):
     note5: str = ""
 
 
+# 수신자 목록 -> payload dict 변환 (pydantic-core 에서 일괄 직렬화)
+_MAIL_RECEIVER_ADAPTER = TypeAdapter(list[MailReceiver], config=ConfigDict(defer_build=True))
+_SMS_RECEIVER_ADAPTER = TypeAdapter(list[SMSReceiver], config=ConfigDict(defer_build=True))
+
+
 class MailRequest(BaseModel):
     """메일 발송 요청"""
+    model_config = ConfigDict(defer_build=True)
+    
     subject: str
     body: str
     receivers: list[MailReceiver]
@@ -42,6 +57,8 @@ class MailRequest(BaseModel):
 
 class SMSRequest(BaseModel):
     """SMS 발송 요청"""
+    model_config = ConfigDict(defer_build=True)
+    
     title: str  # MMS/LMS 제목 (최대 40byte)
     message: str  # 메시지 내용 (최대 2000byte)
     receivers: list[SMSReceiver]
@@ -49,21 +66,75 @@ class SMSRequest(BaseModel):
 
 class DirectSendResponse(BaseModel):
     """DirectSend API 응답"""
+    model_config = ConfigDict(defer_build=True)
+    
     status: int
     msg: str
     data: dict[str, Any] | None = None
 
 
+def _parse_chunk_result(result: Any) -> DirectSendResponse:
+    """gather 결과(응답 또는 예외) 하나를 DirectSendResponse로 변환"""
+    if isinstance(result, httpx.RequestError):
+        return DirectSendResponse(
+            status=-1,
+            msg=f"Request failed: {str(result)}"
+        )
+    if isinstance(result, asyncio.CancelledError):
+        # 취소는 오류 응답으로 바꾸지 않고 호출자에게 전파
+        raise result
+    if isinstance(result, BaseException):
+        return DirectSendResponse(
+            status=-1,
+            msg=f"Unexpected error: {str(result)}"
+        )
+    try:
+        data = _json_loads(result.content)
+    except Exception as e:
+        return DirectSendResponse(
+            status=-1,
+            msg=f"Unexpected error: {str(e)}"
+        )
+    return DirectSendResponse(
+        status=data.get("status", -1),
+        msg=data.get("msg", "Unknown error"),
+        data=data
+    )
+
+
+def _merge_chunk_results(results: list[Any]) -> DirectSendResponse:
+    """
+    청크별 응답을 하나의 DirectSendResponse로 병합
+    
+    청크가 하나면 기존 응답 형태 그대로 반환하고,
+    여러 개면 첫 번째 실패 응답의 status/msg를 우선 사용한다.
+    """
+    parsed = [_parse_chunk_result(r) for r in results]
+    if len(parsed) == 1:
+        return parsed[0]
+    
+    head = next((p for p in parsed if p.status != 0), parsed[0])
+    # 이미 검증된 청크 응답의 조합이므로 재검증 생략
+    return DirectSendResponse.model_construct(
+        status=head.status,
+        msg=head.msg,
+        data={"chunks": [p.model_dump() for p in parsed]}
+    )
+
+
 class DirectSendMailService:
     """DirectSend 메일 발송 서비스"""
     
     BASE_URL = "https://directsend.co.kr/index.php/api_v2/mail_change_word"
+    CHUNK = 500  # 요청 1건당 최대 수신자 수
     
     def __init__(self):
         self.username = settings.DIRECTSEND_USERNAME
         self.api_key = settings.DIRECTSEND_API_KEY
         self.sender_email = settings.DIRECTSEND_SENDER_EMAIL
         self.sender_name = settings.DIRECTSEND_SENDER_NAME
+        self._client: httpx.AsyncClient | None = None
+        self._url = httpx.URL(self.BASE_URL)  # 고정 엔드포인트 URL 1회 파싱
     
     @property
     def is_configured(self) -> bool:
@@ -74,6 +145,23 @@ class DirectSendMailService:
             self.sender_email
         )
     
+    async def _get_client(self) -> httpx.AsyncClient:
+        """keep-alive 연결을 재사용하는 공유 클라이언트 (최초 호출 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,  # 청크 요청을 하나의 연결에 다중화
+                timeout=30.0,
+                headers={"Content-Type": "application/json"},
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """공유 클라이언트 종료 (앱 shutdown 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def send_mail(self, request: MailRequest) -> DirectSendResponse:
         """
         메일 발송
@@ -91,18 +179,7 @@ class DirectSendMailService:
             )
         
         # 수신자 데이터 포맷
-        receivers_data = [
-            {
-                "name": r.name,
-                "email": r.email,
-                "note1": r.note1,
-                "note2": r.note2,
-                "note3": r.note3,
-                "note4": r.note4,
-                "note5": r.note5,
-            }
-            for r in request.receivers
-        ]
+        receivers_data = _MAIL_RECEIVER_ADAPTER.dump_python(request.receivers)
         
         payload = {
             "username": self.username,
@@ -111,29 +188,23 @@ class DirectSendMailService:
             "sender_name": request.sender_name or self.sender_name,
             "subject": request.subject,
             "body": request.body,
-            "receiver": receivers_data,
             "body_tag": "Y",  # HTML 사용
         }
         
+        # 수신자를 CHUNK 단위로 나눠 동시에 발송
+        chunks = [
+            receivers_data[i:i + self.CHUNK]
+            for i in range(0, len(receivers_data), self.CHUNK)
+        ] or [[]]
+        payloads = [{**payload, "receiver": chunk} for chunk in chunks]
+        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.BASE_URL,
-                    json=payload,
-                    timeout=30.0
-                )
-                result = response.json()
-                
-                return DirectSendResponse(
-                    status=result.get("status", -1),
-                    msg=result.get("msg", "Unknown error"),
-                    data=result
-                )
-        except httpx.RequestError as e:
-            return DirectSendResponse(
-                status=-1,
-                msg=f"Request failed: {str(e)}"
+            client = await self._get_client()
+            results = await asyncio.gather(
+                *(client.post(self._url, content=_json_dumps(p)) for p in payloads),
+                return_exceptions=True
             )
+            return _merge_chunk_results(results)
         except Exception as e:
             return DirectSendResponse(
                 status=-1,
@@ -145,11 +216,14 @@ class DirectSendSMSService:
     """DirectSend SMS 발송 서비스"""
     
     BASE_URL = "https://directsend.co.kr/index.php/api_v2/sms_change_word"
+    CHUNK = 500  # 요청 1건당 최대 수신자 수
     
     def __init__(self):
         self.username = settings.DIRECTSEND_USERNAME
         self.api_key = settings.DIRECTSEND_API_KEY
         self.sender_phone = settings.DIRECTSEND_SENDER_PHONE
+        self._client: httpx.AsyncClient | None = None
+        self._url = httpx.URL(self.BASE_URL)  # 고정 엔드포인트 URL 1회 파싱
     
     @property
     def is_configured(self) -> bool:
@@ -160,6 +234,23 @@ class DirectSendSMSService:
             self.sender_phone
         )
     
+    async def _get_client(self) -> httpx.AsyncClient:
+        """keep-alive 연결을 재사용하는 공유 클라이언트 (최초 호출 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,  # 청크 요청을 하나의 연결에 다중화
+                timeout=30.0,
+                headers={"Content-Type": "application/json"},
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """공유 클라이언트 종료 (앱 shutdown 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def send_sms(self, request: SMSRequest) -> DirectSendResponse:
         """
         SMS 발송
@@ -177,18 +268,7 @@ class DirectSendSMSService:
             )
         
         # 수신자 데이터 포맷
-        receivers_data = [
-            {
-                "name": r.name,
-                "mobile": r.mobile,
-                "note1": r.note1,
-                "note2": r.note2,
-                "note3": r.note3,
-                "note4": r.note4,
-                "note5": r.note5,
-            }
-            for r in request.receivers
-        ]
+        receivers_data = _SMS_RECEIVER_ADAPTER.dump_python(request.receivers)
         
         payload = {
             "username": self.username,
@@ -196,28 +276,22 @@ class DirectSendSMSService:
             "sender": self.sender_phone,
             "title": request.title,
             "message": request.message,
-            "receiver": receivers_data,
         }
         
+        # 수신자를 CHUNK 단위로 나눠 동시에 발송
+        chunks = [
+            receivers_data[i:i + self.CHUNK]
+            for i in range(0, len(receivers_data), self.CHUNK)
+        ] or [[]]
+        payloads = [{**payload, "receiver": chunk} for chunk in chunks]
+        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.BASE_URL,
-                    json=payload,
-                    timeout=30.0
-                )
-                result = response.json()
-                
-                return DirectSendResponse(
-                    status=result.get("status", -1),
-                    msg=result.get("msg", "Unknown error"),
-                    data=result
-                )
-        except httpx.RequestError as e:
-            return DirectSendResponse(
-                status=-1,
-                msg=f"Request failed: {str(e)}"
+            client = await self._get_client()
+            results = await asyncio.gather(
+                *(client.post(self._url, content=_json_dumps(p)) for p in payloads),
+                return_exceptions=True
             )
+            return _merge_chunk_results(results)
         except Exception as e:
             return DirectSendResponse(
                 status=-1,
@@ -225,7 +299,20 @@ class DirectSendSMSService:
             )
 
 
-# 싱글톤 인스턴스
-mail_service = DirectSendMailService()
-sms_service = DirectSendSMSService()
+# 싱글톤 인스턴스 (최초 호출 시 생성)
+@lru_cache(maxsize=1)
+def get_mail_service() -> DirectSendMailService:
+    return DirectSendMailService()
+
+
+@lru_cache(maxsize=1)
+def get_sms_service() -> DirectSendSMSService:
+    return DirectSendSMSService()
+
+
 
+async def close_services() -> None:
+    """생성된 서비스의 공유 클라이언트만 종료 (앱 shutdown 용, 미사용 서비스는 생성하지 않음)"""
+    for factory in (get_mail_service, get_sms_service):
+        if factory.cache_info().currsize:
+            await factory().aclose()
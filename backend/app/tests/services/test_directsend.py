@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+import httpx
+
+from app.services.directsend import (
+    DirectSendMailService,
+    MailReceiver,
+    MailRequest,
+)
+
+
+def _mail_service(handler) -> DirectSendMailService:
+    service = DirectSendMailService()
+    service.username = "user"
+    service.api_key = "key"
+    service.sender_email = "sender@example.com"
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+def _mail_request(count: int) -> MailRequest:
+    return MailRequest(
+        subject="subject",
+        body="body",
+        receivers=[
+            MailReceiver(name=f"user{i}", email=f"user{i}@example.com")
+            for i in range(count)
+        ],
+    )
+
+
+def test_send_mail_splits_receivers_into_chunks() -> None:
+    sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sizes.append(len(json.loads(request.content)["receiver"]))
+        return httpx.Response(200, json={"status": 0, "msg": "ok"})
+
+    service = _mail_service(handler)
+    response = asyncio.run(service.send_mail(_mail_request(1200)))
+
+    assert sorted(sizes, reverse=True) == [500, 500, 200]
+    assert response.status == 0
+    assert len(response.data["chunks"]) == 3
+
+
+def test_send_mail_reports_failed_chunk_status() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        receivers = json.loads(request.content)["receiver"]
+        if receivers[0]["name"] == "user500":
+            return httpx.Response(200, json={"status": 102, "msg": "failed"})
+        return httpx.Response(200, json={"status": 0, "msg": "ok"})
+
+    service = _mail_service(handler)
+    response = asyncio.run(service.send_mail(_mail_request(1200)))
+
+    assert response.status == 102
+    assert response.msg == "failed"
+    assert [c["status"] for c in response.data["chunks"]] == [0, 102, 0]
+
+
+def test_send_mail_without_receivers_sends_single_request() -> None:
+    payloads: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json={"status": 0, "msg": "ok"})
+
+    service = _mail_service(handler)
+    response = asyncio.run(service.send_mail(_mail_request(0)))
+
+    assert len(payloads) == 1
+    assert payloads[0]["receiver"] == []
+    assert response.status == 0